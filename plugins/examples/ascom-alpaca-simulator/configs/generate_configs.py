@@ -6,6 +6,9 @@ with different mount types (Alt/Az, Equatorial, German Equatorial)
 
 import os
 import uuid
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # Seestar specifications
 SEESTAR_SPECS = {
@@ -82,12 +85,29 @@ LOCATION = {
     'elevation': 306
 }
 
+# Summary printed once all files are written
+SUMMARY = """
+✓ All configurations generated successfully!
 
-def create_telescope_config(model, mount_type, specs):
-    """Generate telescope configuration XML"""
-    mount = MOUNT_TYPES[mount_type]
-    
-    return f"""﻿<?xml version="1.0" encoding="utf-8"?>
+Configurations saved to: {base_path}
+
+Structure:
+  s30/
+  ├── altaz/
+  ├── equatorial/
+  └── german-equatorial/
+  s30-pro/
+  ├── altaz/
+  ├── equatorial/
+  └── german-equatorial/
+  s50/
+  ├── altaz/
+  ├── equatorial/
+  └── german-equatorial/"""
+
+
+# Device configuration templates, filled in with str.format_map() per file
+TELESCOPE_TEMPLATE = """﻿<?xml version="1.0" encoding="utf-8"?>
 <ArrayOfSettingsPair xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:xsd="http://www.w3.org/2001/XMLSchema">
   <SettingsPair>
     <Key>RegVer</Key>
@@ -111,7 +131,7 @@ def create_telescope_config(model, mount_type, specs):
   </SettingsPair>
   <SettingsPair>
     <Key>UniqueID</Key>
-    <Value>{specs['uuid_telescope']}</Value>
+    <Value>{uuid_telescope}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>AutoTrack</Key>
@@ -135,31 +155,31 @@ def create_telescope_config(model, mount_type, specs):
   </SettingsPair>
   <SettingsPair>
     <Key>Latitude</Key>
-    <Value>{LOCATION['latitude']}</Value>
+    <Value>{latitude}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>Longitude</Key>
-    <Value>{LOCATION['longitude']}</Value>
+    <Value>{longitude}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>Elevation</Key>
-    <Value>{LOCATION['elevation']}</Value>
+    <Value>{elevation}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>AlignMode</Key>
-    <Value>{mount['align_mode']}</Value>
+    <Value>{align_mode}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>Aperture</Key>
-    <Value>{specs['aperture']}</Value>
+    <Value>{aperture}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>ApertureArea</Key>
-    <Value>{specs['aperture_area']}</Value>
+    <Value>{aperture_area}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>FocalLength</Key>
-    <Value>{specs['focal_length']}</Value>
+    <Value>{focal_length}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>StartUpMode</Key>
@@ -167,23 +187,23 @@ def create_telescope_config(model, mount_type, specs):
   </SettingsPair>
   <SettingsPair>
     <Key>CanAltAz</Key>
-    <Value>{mount['can_altaz']}</Value>
+    <Value>{can_altaz}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>CanSlewAltAz</Key>
-    <Value>{mount['can_altaz']}</Value>
+    <Value>{can_altaz}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>CanSyncAltAz</Key>
-    <Value>{mount['can_altaz']}</Value>
+    <Value>{can_altaz}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>CanSlewAltAzAsync</Key>
-    <Value>{mount['can_altaz']}</Value>
+    <Value>{can_altaz}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>CanEquatorial</Key>
-    <Value>{mount['can_equatorial']}</Value>
+    <Value>{can_equatorial}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>CanSlew</Key>
@@ -323,14 +343,11 @@ def create_telescope_config(model, mount_type, specs):
   </SettingsPair>
 </ArrayOfSettingsPair>"""
 
-
-def create_camera_config(specs):
-    """Generate camera configuration XML"""
-    return f"""﻿<?xml version="1.0" encoding="utf-8"?>
+CAMERA_TEMPLATE = """﻿<?xml version="1.0" encoding="utf-8"?>
 <ArrayOfSettingsPair xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:xsd="http://www.w3.org/2001/XMLSchema">
   <SettingsPair>
     <Key>UniqueID</Key>
-    <Value>{specs['uuid_camera']}</Value>
+    <Value>{uuid_camera}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>InterfaceVersion</Key>
@@ -338,11 +355,11 @@ def create_camera_config(specs):
   </SettingsPair>
   <SettingsPair>
     <Key>PixelSizeX</Key>
-    <Value>{specs['pixel_size']}</Value>
+    <Value>{pixel_size}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>PixelSizeY</Key>
-    <Value>{specs['pixel_size']}</Value>
+    <Value>{pixel_size}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>FullWellCapacity</Key>
@@ -358,11 +375,11 @@ def create_camera_config(specs):
   </SettingsPair>
   <SettingsPair>
     <Key>CameraXSize</Key>
-    <Value>{specs['resolution_x']}</Value>
+    <Value>{resolution_x}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>CameraYSize</Key>
-    <Value>{specs['resolution_y']}</Value>
+    <Value>{resolution_y}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>CanAsymmetricBin</Key>
@@ -382,7 +399,7 @@ def create_camera_config(specs):
   </SettingsPair>
   <SettingsPair>
     <Key>SensorName</Key>
-    <Value>{specs['sensor']}</Value>
+    <Value>{sensor}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>SensorType</Key>
@@ -498,14 +515,11 @@ def create_camera_config(specs):
   </SettingsPair>
 </ArrayOfSettingsPair>"""
 
-
-def create_filterwheel_config(specs):
-    """Generate filter wheel configuration XML"""
-    return f"""﻿<?xml version="1.0" encoding="utf-8"?>
+FILTERWHEEL_TEMPLATE = """﻿<?xml version="1.0" encoding="utf-8"?>
 <ArrayOfSettingsPair xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:xsd="http://www.w3.org/2001/XMLSchema">
   <SettingsPair>
     <Key>UniqueID</Key>
-    <Value>{specs['uuid_filterwheel']}</Value>
+    <Value>{uuid_filterwheel}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>RegVer</Key>
@@ -577,14 +591,11 @@ def create_filterwheel_config(specs):
   </SettingsPair>
 </ArrayOfSettingsPair>"""
 
-
-def create_focuser_config(specs):
-    """Generate focuser configuration XML"""
-    return f"""﻿<?xml version="1.0" encoding="utf-8"?>
+FOCUSER_TEMPLATE = """﻿<?xml version="1.0" encoding="utf-8"?>
 <ArrayOfSettingsPair xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:xsd="http://www.w3.org/2001/XMLSchema">
   <SettingsPair>
     <Key>UniqueID</Key>
-    <Value>{specs['uuid_focuser']}</Value>
+    <Value>{uuid_focuser}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>Absolute</Key>
@@ -656,14 +667,11 @@ def create_focuser_config(specs):
   </SettingsPair>
 </ArrayOfSettingsPair>"""
 
-
-def create_switch_config(specs):
-    """Generate switch configuration XML (dew heater)"""
-    return f"""﻿<?xml version="1.0" encoding="utf-8"?>
+SWITCH_TEMPLATE = """﻿<?xml version="1.0" encoding="utf-8"?>
 <ArrayOfSettingsPair xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:xsd="http://www.w3.org/2001/XMLSchema">
   <SettingsPair>
     <Key>UniqueID</Key>
-    <Value>{specs['uuid_switch']}</Value>
+    <Value>{uuid_switch}</Value>
   </SettingsPair>
   <SettingsPair>
     <Key>NumSwitches</Key>
@@ -708,58 +716,90 @@ def create_switch_config(specs):
 </ArrayOfSettingsPair>"""
 
 
+class _PartialFields(ChainMap):
+    """format_map() mapping that leaves unresolved placeholders in place"""
+
+    def __missing__(self, key):
+        return f'{{{key}}}'
+
+
+def create_telescope_template(specs):
+    """Pre-render the model-specific parts of the telescope configuration"""
+    return TELESCOPE_TEMPLATE.format_map(_PartialFields(specs, LOCATION))
+
+
+def create_telescope_config(model, mount_type, specs, template=None):
+    """Generate telescope configuration XML"""
+    if template is None:
+        template = create_telescope_template(specs)
+    return template.format_map(MOUNT_TYPES[mount_type])
+
+
+def create_camera_config(specs):
+    """Generate camera configuration XML"""
+    return CAMERA_TEMPLATE.format_map(specs)
+
+
+def create_filterwheel_config(specs):
+    """Generate filter wheel configuration XML"""
+    return FILTERWHEEL_TEMPLATE.format_map(specs)
+
+
+def create_focuser_config(specs):
+    """Generate focuser configuration XML"""
+    return FOCUSER_TEMPLATE.format_map(specs)
+
+
+def create_switch_config(specs):
+    """Generate switch configuration XML (dew heater)"""
+    return SWITCH_TEMPLATE.format_map(specs)
+
+
 def main():
     """Generate all configuration files"""
     base_path = "/tmp/seestar-configs"
-    
+
+    # Create every output directory up front in one sorted pass
+    dirs = {
+        os.path.join(base_path, model, mount_type, device, "v1")
+        for model in SEESTAR_SPECS
+        for mount_type in MOUNT_TYPES
+        for device in ("telescope", "camera", "filterwheel", "focuser", "switch")
+    }
+    for d in sorted(dirs):
+        os.makedirs(d, exist_ok=True)
+
+    # Render everything into memory first, then write the files in parallel
+    jobs = []
     for model, specs in SEESTAR_SPECS.items():
         print(f"Generating configurations for {specs['name']}...")
         
+        # Only the telescope config depends on the mount type, so everything
+        # else is rendered and encoded once per model
+        telescope_template = create_telescope_template(specs)
+        camera_xml = create_camera_config(specs).encode('utf-8')
+        filterwheel_xml = create_filterwheel_config(specs).encode('utf-8')
+        focuser_xml = create_focuser_config(specs).encode('utf-8')
+        switch_xml = create_switch_config(specs).encode('utf-8')
+        
         for mount_type in MOUNT_TYPES.keys():
             print(f"  - {mount_type} mount")
-            mount_path = os.path.join(base_path, model, mount_type)
+            mount_path = Path(base_path, model, mount_type)
+            telescope_xml = create_telescope_config(model, mount_type, specs, telescope_template)
             
-            # Telescope config
-            telescope_file = os.path.join(mount_path, "telescope/v1/instance-0.xml")
-            with open(telescope_file, 'w') as f:
-                f.write(create_telescope_config(model, mount_type, specs))
-            
-            # Camera config
-            camera_file = os.path.join(mount_path, "camera/v1/instance-0.xml")
-            with open(camera_file, 'w') as f:
-                f.write(create_camera_config(specs))
-            
-            # Filter wheel config
-            filterwheel_file = os.path.join(mount_path, "filterwheel/v1/instance-0.xml")
-            with open(filterwheel_file, 'w') as f:
-                f.write(create_filterwheel_config(specs))
-            
-            # Focuser config
-            focuser_file = os.path.join(mount_path, "focuser/v1/instance-0.xml")
-            with open(focuser_file, 'w') as f:
-                f.write(create_focuser_config(specs))
-            
-            # Switch config
-            switch_file = os.path.join(mount_path, "switch/v1/instance-0.xml")
-            with open(switch_file, 'w') as f:
-                f.write(create_switch_config(specs))
+            jobs.extend([
+                (mount_path / "telescope/v1/instance-0.xml", telescope_xml.encode('utf-8')),
+                (mount_path / "camera/v1/instance-0.xml", camera_xml),
+                (mount_path / "filterwheel/v1/instance-0.xml", filterwheel_xml),
+                (mount_path / "focuser/v1/instance-0.xml", focuser_xml),
+                (mount_path / "switch/v1/instance-0.xml", switch_xml),
+            ])
     
-    print("\n✓ All configurations generated successfully!")
-    print(f"\nConfigurations saved to: {base_path}")
-    print("\nStructure:")
-    print("  s30/")
-    print("  ├── altaz/")
-    print("  ├── equatorial/")
-    print("  └── german-equatorial/")
-    print("  s30-pro/")
-    print("  ├── altaz/")
-    print("  ├── equatorial/")
-    print("  └── german-equatorial/")
-    print("  s50/")
-    print("  ├── altaz/")
-    print("  ├── equatorial/")
-    print("  └── german-equatorial/")
-
+    with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+        # Consume the results so any write error is raised here
+        list(executor.map(lambda job: job[0].write_bytes(job[1]), jobs))
+    
+    print(SUMMARY.format(base_path=base_path))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,18 @@
+"""
+BigSkies GTK UI package.
+
+``Gtk`` is exported from here so ``gi.require_version`` runs once per process
+instead of in every module. It is loaded on first access, so importing the
+package alone does not pull in GObject introspection.
+"""
+
+
+def __getattr__(name):
+    """Load ``Gtk`` lazily on first access."""
+    if name == "Gtk":
+        import gi
+        gi.require_version('Gtk', '3.0')
+        from gi.repository import Gtk
+        globals()["Gtk"] = Gtk
+        return Gtk
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
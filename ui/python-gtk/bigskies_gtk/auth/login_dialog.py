@@ -1,9 +1,7 @@
 """
 Authentication dialog for BigSkies framework.
 """
-import gi
-gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
+from .. import Gtk
 import logging
 
 logger = logging.getLogger(__name__)
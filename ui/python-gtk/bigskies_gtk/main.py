@@ -3,10 +3,6 @@
 BigSkies GTK Application Entry Point
 """
 import sys
-import gi
-
-gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
 
 from .app import BigSkiesApp
 
@@ -2,19 +2,59 @@
 MQTT client wrapper for BigSkies framework.
 Handles connection, subscription, and message publishing with BigSkies topic structure.
 """
+import functools
 import json
 import logging
-import uuid
-from typing import Callable, Optional, Dict, Any
+import os
+from collections import deque
+from typing import Callable, Optional, Dict, Any, List, Tuple, Union
 import paho.mqtt.client as mqtt
 from gi.repository import GLib
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .matcher import TopicMatcher
+
 logger = logging.getLogger(__name__)
 
+# Payload codec working on raw bytes; orjson is used when installed
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+
+def decode_payload(payload: bytes) -> Dict[str, Any]:
+    """
+    Decode a raw JSON message payload.
+    
+    Args:
+        payload: Raw message payload, empty payloads decode to an empty dict
+        
+    Returns:
+        Decoded payload
+        
+    Raises:
+        ValueError: If the payload is not valid JSON
+    """
+    return _loads(payload) if payload else {}
+
 
 class BigSkiesMQTTClient:
     """MQTT client wrapper for BigSkies framework communication."""
     
+    # Received messages buffered for the main thread; the oldest are dropped when full
+    RX_QUEUE_SIZE = 1000
+    # Messages handled per main loop iteration before yielding to GTK
+    RX_BATCH_SIZE = 100
+    
     def __init__(self, broker_host: str = "localhost", broker_port: int = 1883):
         """
         Initialize MQTT client.
@@ -25,7 +65,7 @@ class BigSkiesMQTTClient:
         """
         self.broker_host = broker_host
         self.broker_port = broker_port
-        self.client_id = f"bigskies-gtk-{uuid.uuid4().hex[:8]}"
+        self.client_id = f"bigskies-gtk-{os.urandom(4).hex()}"
         self.client = mqtt.Client(client_id=self.client_id)
         self.client.on_connect = self._on_connect
         self.client.on_disconnect = self._on_disconnect
@@ -33,9 +73,19 @@ class BigSkiesMQTTClient:
         
         self.connected = False
         self.message_handlers: Dict[str, list] = {}
+        self._matcher = TopicMatcher()
+        # Per-topic cache of matching handler lists, cleared when a filter is added
+        self._resolve_handlers = functools.lru_cache(maxsize=1024)(self._match_handlers)
         self.connect_callback: Optional[Callable] = None
         self.disconnect_callback: Optional[Callable] = None
         
+        # Raw (topic, payload) pairs handed from the network thread to the main thread
+        self._rx_queue = deque(maxlen=self.RX_QUEUE_SIZE)
+        self._drain_scheduled = False
+        # Set while the queue is full and dropping messages, so each overflow
+        # is logged once
+        self._rx_overflowing = False
+        
     def set_callbacks(self, 
                      on_connect: Optional[Callable] = None,
                      on_disconnect: Optional[Callable] = None):
@@ -65,34 +115,64 @@ class BigSkiesMQTTClient:
         self.client.loop_stop()
         self.client.disconnect()
         
-    def subscribe(self, topic: str, callback: Callable[[str, Dict[str, Any]], None]):
+    def subscribe(self, topic: str, callback: Callable[[str, Any], None], raw: bool = False):
         """
         Subscribe to MQTT topic with callback.
         
         Args:
             topic: MQTT topic to subscribe to
             callback: Function to call when message received (topic, payload_dict)
+            raw: Pass the undecoded payload bytes instead, so the callback can skip
+                 decoding messages it ignores (see decode_payload())
         """
-        if topic not in self.message_handlers:
-            self.message_handlers[topic] = []
+        if self._add_handler(topic, callback, raw):
             self.client.subscribe(topic)
             logger.info(f"Subscribed to topic: {topic}")
+            
+    def subscribe_many(self, items: List[Tuple[str, Callable[[str, Dict[str, Any]], None]]]):
+        """
+        Subscribe to several MQTT topics with a single SUBSCRIBE request.
         
-        self.message_handlers[topic].append(callback)
+        Args:
+            items: (topic, callback) pairs, as passed to subscribe()
+        """
+        new_topics = [topic for topic, callback in items
+                      if self._add_handler(topic, callback)]
+        if new_topics:
+            self.client.subscribe([(topic, 0) for topic in new_topics])
+            logger.info(f"Subscribed to topics: {', '.join(new_topics)}")
+            
+    def _add_handler(self, topic: str, callback: Callable[[str, Any], None], raw: bool = False) -> bool:
+        """
+        Register a callback for a topic filter.
         
-    def publish(self, topic: str, payload: Dict[str, Any], qos: int = 1):
+        Returns:
+            True if the topic was not subscribed to before
+        """
+        handlers = self.message_handlers.get(topic)
+        is_new = handlers is None
+        if is_new:
+            # The matcher shares the handler list, so later appends are seen by both
+            handlers = self.message_handlers[topic] = []
+            self._matcher[topic] = handlers
+            self._resolve_handlers.cache_clear()
+        
+        handlers.append((callback, raw))
+        return is_new
+        
+    def publish(self, topic: str, payload: Union[Dict[str, Any], bytes], qos: int = 1):
         """
         Publish message to MQTT topic.
         
         Args:
             topic: MQTT topic
-            payload: Message payload as dictionary
+            payload: Message payload as dictionary, or already encoded JSON bytes
             qos: Quality of service level
         """
         try:
-            payload_str = json.dumps(payload)
-            self.client.publish(topic, payload_str, qos=qos)
-            logger.debug(f"Published to {topic}: {payload_str}")
+            payload_bytes = payload if isinstance(payload, bytes) else _dumps(payload)
+            self.client.publish(topic, payload_bytes, qos=qos)
+            logger.debug(f"Published to {topic}: {payload_bytes!r}")
         except Exception as e:
             logger.error(f"Failed to publish to {topic}: {e}")
             
@@ -102,9 +182,9 @@ class BigSkiesMQTTClient:
             self.connected = True
             logger.info("Connected to MQTT broker")
             
-            # Resubscribe to all topics
-            for topic in self.message_handlers.keys():
-                client.subscribe(topic)
+            # Resubscribe to all topics in one request
+            if self.message_handlers:
+                client.subscribe([(topic, 0) for topic in self.message_handlers])
                 
             # Call connect callback on main thread
             if self.connect_callback:
@@ -122,57 +202,89 @@ class BigSkiesMQTTClient:
             GLib.idle_add(self.disconnect_callback)
             
     def _on_message(self, client, userdata, msg):
-        """Handle incoming MQTT message."""
-        try:
-            # Decode payload
-            payload_str = msg.payload.decode('utf-8')
-            payload_dict = json.loads(payload_str) if payload_str else {}
-            
-            logger.debug(f"Received message on {msg.topic}")
+        """Handle incoming MQTT message on the network thread."""
+        # Only queue the raw message here; decoding and dispatch run on the
+        # main thread so the network loop never blocks on JSON parsing
+        if len(self._rx_queue) == self._rx_queue.maxlen and not self._rx_overflowing:
+            self._rx_overflowing = True
+            logger.warning(f"Receive queue full ({self._rx_queue.maxlen} messages), "
+                           f"dropping the oldest, starting with one on {self._rx_queue[0][0]}")
+        self._rx_queue.append((msg.topic, msg.payload))
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            GLib.idle_add(self._drain_rx)
             
-            # Find matching handlers
-            for topic_pattern, handlers in self.message_handlers.items():
-                if self._topic_matches(msg.topic, topic_pattern):
-                    for handler in handlers:
-                        # Call handler on main thread
-                        GLib.idle_add(handler, msg.topic, payload_dict)
-                        
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to decode JSON from {msg.topic}: {e}")
-        except Exception as e:
-            logger.error(f"Error handling message from {msg.topic}: {e}")
-            
-    @staticmethod
-    def _topic_matches(topic: str, pattern: str) -> bool:
+    def _drain_rx(self) -> bool:
         """
-        Check if topic matches pattern (supporting MQTT wildcards).
+        Decode and dispatch queued messages on the main thread.
         
-        Args:
-            topic: Actual topic
-            pattern: Pattern with + (single level) or # (multi level) wildcards
-            
         Returns:
-            True if topic matches pattern
+            True to be called again if messages are left over, False otherwise
         """
-        if pattern == topic:
-            return True
-            
-        topic_parts = topic.split('/')
-        pattern_parts = pattern.split('/')
+        # Clear the flag first so messages arriving mid-drain schedule a new pass
+        self._drain_scheduled = False
         
-        # # must be last and matches everything after
-        if '#' in pattern_parts:
-            hash_idx = pattern_parts.index('#')
-            if hash_idx != len(pattern_parts) - 1:
+        for _ in range(self.RX_BATCH_SIZE):
+            try:
+                topic, payload = self._rx_queue.popleft()
+            except IndexError:
+                # Queue drained, so a later overflow is logged again
+                self._rx_overflowing = False
                 return False
-            pattern_parts = pattern_parts[:hash_idx]
-            topic_parts = topic_parts[:hash_idx]
+            self._dispatch(topic, payload)
             
-        if len(topic_parts) != len(pattern_parts):
-            return False
+        # Batch limit reached, continue in a later main loop iteration
+        if self._rx_queue and not self._drain_scheduled:
+            self._drain_scheduled = True
+            return True
+        return False
+        
+    def _dispatch(self, topic: str, payload: bytes):
+        """
+        Decode a message and call the handlers subscribed to its topic.
+        
+        Args:
+            topic: Actual topic of the message
+            payload: Raw message payload
+        """
+        handler_lists = self._resolve_handlers(topic)
+        if not handler_lists:
+            return
             
-        for topic_part, pattern_part in zip(topic_parts, pattern_parts):
-            if pattern_part != '+' and pattern_part != topic_part:
-                return False
-                
-        return True
+        logger.debug(f"Received message on {topic}")
+        
+        # Decoded on first use, so messages with only raw handlers are never
+        # decoded; an undecodable payload is still passed to raw handlers
+        payload_dict = None
+        decode_failed = False
+        for handlers in handler_lists:
+            for handler, raw in handlers:
+                if raw:
+                    arg = payload
+                else:
+                    if payload_dict is None:
+                        if decode_failed:
+                            continue
+                        try:
+                            payload_dict = decode_payload(payload)
+                        except ValueError as e:
+                            logger.error(f"Failed to decode JSON from {topic}: {e}")
+                            decode_failed = True
+                            continue
+                    arg = payload_dict
+                try:
+                    handler(topic, arg)
+                except Exception as e:
+                    logger.error(f"Error handling message from {topic}: {e}")
+        
+    def _match_handlers(self, topic: str) -> Tuple[list, ...]:
+        """
+        Find the handler lists of every subscription matching a topic.
+        
+        Args:
+            topic: Actual topic of a received message
+            
+        Returns:
+            Handler lists of the matching subscriptions
+        """
+        return tuple(self._matcher.iter_match(topic))
@@ -0,0 +1,115 @@
+"""
+MQTT topic filter matching for BigSkies subscriptions.
+
+Filters without wildcards are kept in a plain dict and matched with a single
+lookup. Wildcard filters are stored in a trie keyed on topic levels, so
+matching an incoming topic costs O(topic depth) instead of comparing it
+against every registered filter. The trie is ported from paho-mqtt's
+``MQTTMatcher``.
+"""
+from typing import Any, Dict, Iterator, Optional, Set
+
+
+class _Node:
+    """A single topic level in the matcher trie."""
+
+    __slots__ = ('children', 'content')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.content: Optional[Any] = None
+
+
+class TopicMatcher:
+    """Map MQTT topic filters to values and look up the ones matching a topic."""
+
+    def __init__(self):
+        self._exact: Dict[str, Any] = {}
+        self._root = _Node()
+        # Level counts of the wildcard filters without '#', and whether any
+        # filter ends in '#'. A topic whose level count is not listed can
+        # only match an exact or '#' filter.
+        self._depths: Set[int] = set()
+        self._multi_level = False
+
+    @staticmethod
+    def _is_exact(pattern: str) -> bool:
+        """Return True if a topic filter contains no wildcards."""
+        return '+' not in pattern and '#' not in pattern
+
+    def __setitem__(self, pattern: str, value: Any):
+        """
+        Store a value for a topic filter.
+
+        Args:
+            pattern: Topic filter, may contain + (single level) or # (multi level) wildcards
+            value: Value returned by iter_match() for matching topics
+        """
+        if self._is_exact(pattern):
+            self._exact[pattern] = value
+            return
+
+        levels = pattern.split('/')
+        node = self._root
+        for level in levels:
+            node = node.children.setdefault(level, _Node())
+        if levels[-1] == '#':
+            self._multi_level = True
+        else:
+            self._depths.add(len(levels))
+        node.content = value
+
+    def iter_match(self, topic: str) -> Iterator[Any]:
+        """
+        Yield the values of every stored filter matching a topic.
+
+        Args:
+            topic: Actual topic of a received message
+
+        Yields:
+            Values stored for the matching filters
+        """
+        value = self._exact.get(topic)
+        if value is not None:
+            yield value
+        first_level = self._root.children
+        if not first_level:
+            return
+
+        # Wildcards do not match a leading $ level (e.g. $SYS topics)
+        normal = not topic.startswith('$')
+
+        # The root level buckets filters by their first topic level, so topics
+        # outside every subscribed namespace are rejected before splitting
+        if topic.partition('/')[0] not in first_level and not (
+                normal and ('+' in first_level or '#' in first_level)):
+            return
+
+        # Without '#' filters, a topic can only match filters with the same
+        # number of levels, which str.count() checks without splitting
+        if not self._multi_level and topic.count('/') + 1 not in self._depths:
+            return
+
+        levels = topic.split('/')
+        depth = len(levels)
+
+        # Walk the trie with an explicit stack rather than nested generators
+        stack = [(self._root, 0)]
+        while stack:
+            node, i = stack.pop()
+            children = node.children
+            if normal or i > 0:
+                child = children.get('#')
+                if child is not None and child.content is not None:
+                    yield child.content
+                if i < depth:
+                    child = children.get('+')
+                    if child is not None:
+                        stack.append((child, i + 1))
+            if i == depth:
+                if node.content is not None:
+                    yield node.content
+            else:
+                child = children.get(levels[i])
+                if child is not None:
+                    stack.append((child, i + 1))
@@ -1,18 +1,28 @@
 """
 Telescope control panel for BigSkies framework.
 """
-import gi
-gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
+from .. import Gtk
+from gi.repository import GLib
+import cairo
 import logging
+import math
 import time
 
 logger = logging.getLogger(__name__)
 
+# Formats a position in degrees, e.g. "123.45°"
+_format_degrees = "%.2f°".__mod__
+
+# Pre-encoded list_configs request; only the request ID timestamp varies
+_LIST_CONFIGS_REQUEST = b'{"command":"list_configs","request_id":"gui-request-%d"}'
+
 
 class ControlPanel(Gtk.Box):
     """Telescope control panel widget."""
     
+    # Position labels are refreshed at most this often (~30 Hz)
+    STATE_REFRESH_MS = 33
+    
     def __init__(self, mqtt_client):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         self.mqtt_client = mqtt_client
@@ -22,6 +32,23 @@ class ControlPanel(Gtk.Box):
         self.selected_mount_type = None
         self.plugin_id = "f7e8d9c6-b5a4-3210-9876-543210fedcba"  # ASCOM Alpaca Simulator plugin ID
         
+        # Plugin topics, formatted once for the fixed plugin ID
+        plugin_topic = f"bigskies/plugin/{self.plugin_id}"
+        self._topic_telescope_state = f"{plugin_topic}/device/telescope/state"
+        self._topic_config_list = f"{plugin_topic}/config/list"
+        self._topic_config_load = f"{plugin_topic}/config/load"
+        self._topic_config_response = f"{plugin_topic}/config/response"
+        self._topic_config_event = f"{plugin_topic}/config/event"
+        
+        # Latest telescope state received since the last refresh, applied on a timer
+        self._pending_state = {}
+        self._refresh_scheduled = False
+        # Text last written to each position label
+        self._label_text = {}
+        # Pre-rendered status indicators keyed by connection state
+        self._indicator_surfaces = {}
+        self._indicator_size = (0, 0)
+        
         self.set_margin_start(10)
         self.set_margin_end(10)
         self.set_margin_top(10)
@@ -40,9 +67,11 @@ class ControlPanel(Gtk.Box):
         self._build_slew_section()
         
         # Subscribe to plugin device state and config responses
-        self.mqtt_client.subscribe(f"bigskies/plugin/{self.plugin_id}/device/telescope/state", self._on_telescope_state)
-        self.mqtt_client.subscribe(f"bigskies/plugin/{self.plugin_id}/config/response", self._on_config_response)
-        self.mqtt_client.subscribe(f"bigskies/plugin/{self.plugin_id}/config/event", self._on_config_event)
+        self.mqtt_client.subscribe_many([
+            (self._topic_telescope_state, self._on_telescope_state),
+            (self._topic_config_response, self._on_config_response),
+            (self._topic_config_event, self._on_config_event),
+        ])
         
         # Request available configurations on startup
         self._request_configurations()
@@ -226,22 +255,44 @@ class ControlPanel(Gtk.Box):
         width = widget.get_allocated_width()
         height = widget.get_allocated_height()
         
+        # Re-render both states only when the widget size changes
+        if (width, height) != self._indicator_size:
+            self._indicator_size = (width, height)
+            self._indicator_surfaces.clear()
+            
+        surface = self._indicator_surfaces.get(self.connected)
+        if surface is None:
+            surface = self._render_status_indicator(cr.get_target(), width, height, self.connected)
+            self._indicator_surfaces[self.connected] = surface
+            
+        cr.set_source_surface(surface, 0, 0)
+        cr.paint()
+        
+    @staticmethod
+    def _render_status_indicator(target, width, height, connected):
+        """Render the status indicator circle into an offscreen surface."""
+        # A similar surface keeps the target's device scale on HiDPI screens
+        surface = target.create_similar(cairo.CONTENT_COLOR_ALPHA, width, height)
+        cr = cairo.Context(surface)
+        
         # Set color based on connection status
-        if self.connected:
+        if connected:
             cr.set_source_rgb(1.0, 0.0, 0.0)  # Red for connected
         else:
             cr.set_source_rgb(0.5, 0.5, 0.5)  # Gray for disconnected
             
         # Draw filled circle
-        cr.arc(width / 2, height / 2, min(width, height) / 2 - 2, 0, 2 * 3.14159)
+        cr.arc(width / 2, height / 2, min(width, height) / 2 - 2, 0, math.tau)
         cr.fill()
         
         # Draw border
         cr.set_source_rgb(0, 0, 0)
         cr.set_line_width(3)
-        cr.arc(width / 2, height / 2, min(width, height) / 2 - 2, 0, 2 * 3.14159)
+        cr.arc(width / 2, height / 2, min(width, height) / 2 - 2, 0, math.tau)
         cr.stroke()
         
+        return surface
+        
     def _on_connect_clicked(self, button):
         """Handle connect button click."""
         self.mqtt_client.publish(
@@ -256,6 +307,24 @@ class ControlPanel(Gtk.Box):
         
     def _on_telescope_state(self, topic, payload):
         """Handle telescope state updates from plugin."""
+        # State messages are full snapshots, so only the latest one of a
+        # burst is applied in the next refresh tick
+        self._pending_state = payload
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            GLib.timeout_add(self.STATE_REFRESH_MS, self._flush_state)
+            
+    def _set_label_text(self, label, text):
+        """Update a label only if its text changed."""
+        if self._label_text.get(label) != text:
+            self._label_text[label] = text
+            label.set_text(text)
+            
+    def _flush_state(self):
+        """Apply the latest telescope state received since the last refresh."""
+        payload = self._pending_state
+        self._refresh_scheduled = False
+        
         # Update connection status
         connected = payload.get("connected", False)
         if connected != self.connected:
@@ -275,7 +344,7 @@ class ControlPanel(Gtk.Box):
             ra_hours = int(ra)
             ra_minutes = int((ra - ra_hours) * 60)
             ra_seconds = int(((ra - ra_hours) * 60 - ra_minutes) * 60)
-            self.ra_value.set_text(f"{ra_hours:02d}:{ra_minutes:02d}:{ra_seconds:02d}")
+            self._set_label_text(self.ra_value, f"{ra_hours:02d}:{ra_minutes:02d}:{ra_seconds:02d}")
             
             # Convert Dec from degrees to DD:MM:SS
             dec_sign = "+" if dec >= 0 else "-"
@@ -283,10 +352,10 @@ class ControlPanel(Gtk.Box):
             dec_deg = int(dec_abs)
             dec_min = int((dec_abs - dec_deg) * 60)
             dec_sec = int(((dec_abs - dec_deg) * 60 - dec_min) * 60)
-            self.dec_value.set_text(f"{dec_sign}{dec_deg:02d}:{dec_min:02d}:{dec_sec:02d}")
+            self._set_label_text(self.dec_value, f"{dec_sign}{dec_deg:02d}:{dec_min:02d}:{dec_sec:02d}")
             
-            self.az_value.set_text(f"{az:.2f}°")
-            self.alt_value.set_text(f"{alt:.2f}°")
+            self._set_label_text(self.az_value, _format_degrees(az))
+            self._set_label_text(self.alt_value, _format_degrees(alt))
             
             # Update slewing status
             slewing = payload.get("slewing", False)
@@ -297,15 +366,14 @@ class ControlPanel(Gtk.Box):
                 if "All" not in self.slew_label.get_text() and "Loading" not in self.slew_label.get_text():
                     self.slew_label.set_text("Idle")
                     
+        return GLib.SOURCE_REMOVE
+                    
     def _request_configurations(self):
         """Request list of available configurations from ASCOM plugin."""
         logger.info("Requesting available configurations from ASCOM plugin")
         self.mqtt_client.publish(
-            f"bigskies/plugin/{self.plugin_id}/config/list",
-            {
-                "command": "list_configs",
-                "request_id": "gui-request-" + str(int(time.time() * 1000))
-            }
+            self._topic_config_list,
+            _LIST_CONFIGS_REQUEST % int(time.time() * 1000)
         )
         
     def _on_config_response(self, topic, payload):
@@ -407,7 +475,7 @@ class ControlPanel(Gtk.Box):
         
         # Publish load config command to ASCOM plugin
         self.mqtt_client.publish(
-            f"bigskies/plugin/{self.plugin_id}/config/load",
+            self._topic_config_load,
             {
                 "command": "load_config",
                 "model": self.selected_model,
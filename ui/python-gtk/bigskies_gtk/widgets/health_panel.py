@@ -1,14 +1,34 @@
 """
 Service health monitoring panel for BigSkies coordinators.
 """
-import gi
-gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, Gdk
+from .. import Gtk
+from gi.repository import Gdk, GLib
 import logging
-from datetime import datetime
+import time
 
 logger = logging.getLogger(__name__)
 
+# Status indicator circles, styled by GTK instead of drawn with Cairo
+_INDICATOR_CSS = b"""
+    .health-indicator {
+        border: 1px solid black;
+        border-radius: 8px;
+        background-color: #808080;
+    }
+    .health-healthy { background-color: #33cc33; }
+    .health-warning { background-color: #ffcc00; }
+    .health-unhealthy { background-color: #e63333; }
+"""
+
+# Statuses with their own indicator color; anything else shows as unknown (gray)
+_INDICATOR_CLASSES = {
+    "healthy": "health-healthy",
+    "warning": "health-warning",
+    "unhealthy": "health-unhealthy",
+}
+
+_INDICATOR_PROVIDER = None
+
 
 class HealthPanel(Gtk.Box):
     """Panel displaying health status of all BigSkies coordinators."""
@@ -28,11 +48,36 @@ class HealthPanel(Gtk.Box):
         self.mqtt_client = mqtt_client
         self.health_widgets = {}
         
+        # Health topic -> coordinator ID, so messages need no topic parsing
+        self._id_from_topic = {
+            f"bigskies/coordinator/{coord_id[:-len('-coordinator')]}/health/status": coord_id
+            for coord_id, _ in self.COORDINATORS
+        }
+        
+        # Latest (status, message, time) per coordinator, applied in one idle tick
+        self._pending_updates = {}
+        self._idle_id = 0
+        
+        # Last formatted update time, reused for updates within the same second
+        self._last_timestamp_second = None
+        self._last_timestamp_str = ""
+        
         self.set_margin_start(10)
         self.set_margin_end(10)
         self.set_margin_top(10)
         self.set_margin_bottom(10)
         
+        # Install the indicator styles once per process
+        global _INDICATOR_PROVIDER
+        if _INDICATOR_PROVIDER is None:
+            _INDICATOR_PROVIDER = Gtk.CssProvider()
+            _INDICATOR_PROVIDER.load_from_data(_INDICATOR_CSS)
+            Gtk.StyleContext.add_provider_for_screen(
+                Gdk.Screen.get_default(),
+                _INDICATOR_PROVIDER,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+        
         # Title
         title = Gtk.Label()
         title.set_markup("<b>Service Health Status</b>")
@@ -44,112 +89,121 @@ class HealthPanel(Gtk.Box):
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         scrolled.set_min_content_height(400)
         
-        list_box = Gtk.ListBox()
-        list_box.set_selection_mode(Gtk.SelectionMode.NONE)
-        scrolled.add(list_box)
-        
-        for coord_id, coord_name in self.COORDINATORS:
-            row = self._create_health_row(coord_id, coord_name)
-            list_box.add(row)
+        # A plain grid of fixed cells; the rows never change, so ListBox
+        # selection and per-row bookkeeping would be wasted
+        grid = Gtk.Grid()
+        grid.set_column_spacing(10)
+        grid.set_row_spacing(10)
+        grid.set_margin_start(10)
+        grid.set_margin_end(10)
+        grid.set_margin_top(5)
+        grid.set_margin_bottom(5)
+        scrolled.add(grid)
+        
+        for row, (coord_id, coord_name) in enumerate(self.COORDINATORS):
+            self._attach_health_row(grid, row, coord_id, coord_name)
             
         self.pack_start(scrolled, True, True, 0)
         
         # Subscribe to health topics
         self.mqtt_client.subscribe("bigskies/coordinator/+/health/status", self._on_health_message)
         
-    def _create_health_row(self, coord_id, coord_name):
-        """Create a health status row for a coordinator."""
-        row = Gtk.ListBoxRow()
-        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-        box.set_margin_start(10)
-        box.set_margin_end(10)
-        box.set_margin_top(5)
-        box.set_margin_bottom(5)
-        
+    def _attach_health_row(self, grid, row, coord_id, coord_name):
+        """Attach the health status widgets of a coordinator to a grid row."""
         # Status indicator (colored circle)
-        indicator = Gtk.DrawingArea()
-        indicator.set_size_request(20, 20)
-        indicator.connect("draw", self._draw_indicator, "unknown")
-        box.pack_start(indicator, False, False, 0)
+        indicator = Gtk.Box()
+        indicator.set_size_request(16, 16)
+        indicator.set_margin_start(2)
+        indicator.set_margin_end(2)
+        indicator.set_valign(Gtk.Align.CENTER)
+        indicator.get_style_context().add_class("health-indicator")
+        grid.attach(indicator, 0, row, 1, 1)
         
         # Coordinator name
         name_label = Gtk.Label(label=coord_name)
         name_label.set_halign(Gtk.Align.START)
         name_label.set_hexpand(True)
-        box.pack_start(name_label, True, True, 0)
+        grid.attach(name_label, 1, row, 1, 1)
         
         # Status text
         status_label = Gtk.Label(label="Unknown")
         status_label.set_halign(Gtk.Align.END)
-        box.pack_start(status_label, False, False, 0)
+        grid.attach(status_label, 2, row, 1, 1)
         
         # Last update time
         time_label = Gtk.Label(label="--:--:--")
         time_label.set_halign(Gtk.Align.END)
         time_label.set_width_chars(10)
-        box.pack_start(time_label, False, False, 0)
-        
-        row.add(box)
+        grid.attach(time_label, 3, row, 1, 1)
         
         self.health_widgets[coord_id] = {
             'indicator': indicator,
             'status_label': status_label,
             'time_label': time_label,
+            'time_second': None,
             'status': 'unknown'
         }
         
-        return row
-        
-    def _draw_indicator(self, widget, cr, status):
-        """Draw status indicator circle."""
-        width = widget.get_allocated_width()
-        height = widget.get_allocated_height()
-        
-        # Set color based on status
-        if status == "healthy":
-            cr.set_source_rgb(0.2, 0.8, 0.2)  # Green
-        elif status == "warning":
-            cr.set_source_rgb(1.0, 0.8, 0.0)  # Yellow
-        elif status == "unhealthy":
-            cr.set_source_rgb(0.9, 0.2, 0.2)  # Red
-        else:
-            cr.set_source_rgb(0.5, 0.5, 0.5)  # Gray
-            
-        # Draw filled circle
-        cr.arc(width / 2, height / 2, min(width, height) / 2 - 2, 0, 2 * 3.14159)
-        cr.fill()
-        
-        # Draw border
-        cr.set_source_rgb(0, 0, 0)
-        cr.set_line_width(1)
-        cr.arc(width / 2, height / 2, min(width, height) / 2 - 2, 0, 2 * 3.14159)
-        cr.stroke()
-        
     def _on_health_message(self, topic, payload):
         """Handle health status message."""
-        logger.info(f"Received health message on topic: {topic}")
-        logger.info(f"Payload: {payload}")
-        
-        # Extract coordinator ID from topic: bigskies/coordinator/<coord-id>/health/status
-        parts = topic.split('/')
-        if len(parts) >= 3:
-            coord_id = parts[2] + "-coordinator"  # Convert "message" to "message-coordinator"
-            logger.info(f"Extracted coordinator ID: {coord_id}")
-            logger.info(f"Known coordinators: {list(self.health_widgets.keys())}")
+        # Lazy %-style debug logging keeps this per-message path allocation free
+        logger.debug("Received health message on topic: %s", topic)
+        
+        # Look up the coordinator ID of the topic, e.g.
+        # bigskies/coordinator/message/health/status -> message-coordinator
+        coord_id = self._id_from_topic.get(topic)
+        if coord_id is None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Unknown coordinator topic %s, known coordinators: %s",
+                         topic, list(self.health_widgets.keys()))
+        
+        if coord_id is not None:
+            # Extract status from nested payload structure
+            status_payload = payload.get('payload', {})
+            status = status_payload.get('status', 'unknown').lower()
+            message = status_payload.get('message', 'No message')
             
-            if coord_id in self.health_widgets:
-                # Extract status from nested payload structure
-                status_payload = payload.get('payload', {})
-                status = status_payload.get('status', 'unknown').lower()
-                message = status_payload.get('message', 'No message')
+            # Keep only the latest update per coordinator until the next idle tick
+            self._pending_updates[coord_id] = (status, message, time.time())
+            if not self._idle_id:
+                self._idle_id = GLib.idle_add(self._apply_pending)
                 
-                widgets = self.health_widgets[coord_id]
+    def _apply_pending(self):
+        """Apply all health updates received since the last idle tick."""
+        self._idle_id = 0
+        pending = self._pending_updates
+        self._pending_updates = {}
+        
+        for coord_id, (status, message, received) in pending.items():
+            widgets = self.health_widgets[coord_id]
+            widgets['status_label'].set_text(message)
+            
+            # Relabel only when the shown second changes, saving the relayout
+            # for coordinators reporting more than once per second
+            second = int(received)
+            if second != widgets['time_second']:
+                widgets['time_second'] = second
+                widgets['time_label'].set_text(self._format_timestamp(received))
+            
+            # Swap the indicator color class; GTK restyles and redraws it
+            if status != widgets['status']:
+                style = widgets['indicator'].get_style_context()
+                old_class = _INDICATOR_CLASSES.get(widgets['status'])
+                if old_class is not None:
+                    style.remove_class(old_class)
+                new_class = _INDICATOR_CLASSES.get(status)
+                if new_class is not None:
+                    style.add_class(new_class)
                 widgets['status'] = status
-                widgets['status_label'].set_text(message)
-                widgets['time_label'].set_text(datetime.now().strftime("%H:%M:%S"))
-                
-                # Redraw indicator
-                widgets['indicator'].connect("draw", self._draw_indicator, status)
-                widgets['indicator'].queue_draw()
-                
-                logger.debug(f"Updated health for {coord_id}: {status}")
+            
+            logger.debug("Updated health for %s: %s", coord_id, status)
+            
+        return GLib.SOURCE_REMOVE
+        
+    def _format_timestamp(self, timestamp):
+        """Format a time.time() value as local HH:MM:SS without strftime."""
+        second = int(timestamp)
+        if second != self._last_timestamp_second:
+            lt = time.localtime(second)
+            self._last_timestamp_str = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+            self._last_timestamp_second = second
+        return self._last_timestamp_str
@@ -1,18 +1,62 @@
 """
 Telescope visual preview widget.
 """
-import gi
-gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
+from .. import Gtk
+from gi.repository import GLib
+import cairo
 import math
 import logging
+import re
+import time
+
+from ..mqtt.client import decode_payload
 
 logger = logging.getLogger(__name__)
 
+# Boolean states are usually a bare {"value": true}, matched without decoding
+_BOOL_PAYLOAD = re.compile(rb'\s*\{\s*"value"\s*:\s*(true|false)\s*\}\s*')
+
+# (sin, cos) of the azimuth spokes drawn every 45°, starting at north
+_SPOKE_DIRECTIONS = tuple(
+    (math.sin(math.radians(az_deg)), math.cos(math.radians(az_deg)))
+    for az_deg in range(0, 360, 45)
+)
+
+# Source patterns shared by every draw instead of a new one per set_source_rgb()
+_BACKGROUND = cairo.SolidPattern(0.1, 0.1, 0.15)
+_HORIZON = cairo.SolidPattern(0.3, 0.3, 0.4)
+_CARDINAL = cairo.SolidPattern(0.6, 0.6, 0.7)
+_GRID = cairo.SolidPattern(0.2, 0.2, 0.25)
+_SLEWING = cairo.SolidPattern(1.0, 0.6, 0.0)  # Orange
+_IDLE = cairo.SolidPattern(0.2, 0.8, 0.2)  # Green
+_COORD_TEXT = cairo.SolidPattern(1.0, 1.0, 1.0)
+_DISCONNECTED_TEXT = cairo.SolidPattern(0.7, 0.7, 0.7)
+
+# sin/cos of the 0.3 rad half angle at the pointer triangle's tip
+_SIN_03 = math.sin(0.3)
+_COS_03 = math.cos(0.3)
+
 
 class TelescopePreview(Gtk.DrawingArea):
     """Visual telescope orientation preview."""
     
+    # Telescope state topics are STATE_TOPIC_PREFIX + <state type>
+    STATE_TOPIC_PREFIX = "bigskies/telescope/0/state/"
+    
+    # Azimuth/altitude updates arriving within MIN_REDRAW_INTERVAL seconds of
+    # the last redraw are skipped unless they move more than MIN_REDRAW_DELTA
+    # degrees; the last skipped value is drawn by a trailing timeout
+    MIN_REDRAW_INTERVAL = 0.1
+    MIN_REDRAW_DELTA = 0.05
+    # Coordinate updates closer than this to the current value are ignored
+    DUPLICATE_DELTA = 0.01
+    
+    # Half size of the area invalidated around the pointer tip: the 15 px
+    # triangle plus a pixel of antialiasing
+    POINTER_EXTENT = 17
+    # Height of the coordinate text strip at the bottom of the widget
+    COORD_TEXT_HEIGHT = 26
+    
     def __init__(self, mqtt_client):
         super().__init__()
         self.mqtt_client = mqtt_client
@@ -24,56 +68,255 @@ class TelescopePreview(Gtk.DrawingArea):
         self.connected = False
         self.slewing = False
         
+        # Whether a redraw is already scheduled for the next idle cycle
+        self._redraw_pending = False
+        # Whether the next redraw must cover the whole widget
+        self._full_redraw = False
+        # Area covered by the pointer in the last frame, None if not drawn
+        self._last_pointer_rect = None
+        
+        # Redraw throttling state for the azimuth/altitude updates
+        self._last_emit_ts = {'azimuth': 0.0, 'altitude': 0.0}
+        self._drawn_values = {'azimuth': self.azimuth, 'altitude': self.altitude}
+        self._trailing_redraw_id = None
+        
+        # Offscreen background, re-rendered when the widget is resized
+        self._bg_surface = None
+        self._bg_size = (0, 0)
+        # Background with the disconnected message, reset with the background
+        self._disconnected_surface = None
+        
+        # Font face resolved once instead of by name on every draw
+        self._font_face = cairo.ToyFontFace("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL)
+        
+        # State type -> handler for telescope state messages
+        self._state_dispatch = {
+            "connected": self._set_connected,
+            "azimuth": self._set_azimuth,
+            "altitude": self._set_altitude,
+            "slewing": self._set_slewing,
+        }
+        
         # Connect draw signal
         self.connect("draw", self._on_draw)
         
-        # Subscribe to telescope state
-        self.mqtt_client.subscribe("bigskies/telescope/0/state/#", self._on_telescope_state)
+        # Subscribe to telescope state; payloads are decoded only for the
+        # state types shown in the preview
+        self.mqtt_client.subscribe(self.STATE_TOPIC_PREFIX + "#", self._on_telescope_state, raw=True)
         
     def _on_telescope_state(self, topic, payload):
         """Handle telescope state updates."""
-        parts = topic.split('/')
-        if len(parts) >= 4:
-            state_type = parts[3]
+        # The subscription guarantees the prefix, so the state type is the
+        # next topic level (e.g. bigskies/telescope/0/state/azimuth)
+        state_type, _, _ = topic[len(self.STATE_TOPIC_PREFIX):].partition('/')
+        
+        handler = self._state_dispatch.get(state_type)
+        if handler is None:
+            return
             
-            if state_type == "connected":
-                self.connected = payload.get("value", False)
-                self.queue_draw()
-                
-            elif state_type == "azimuth":
-                self.azimuth = payload.get("value", 0.0)
-                self.queue_draw()
-                
-            elif state_type == "altitude":
-                self.altitude = payload.get("value", 45.0)
-                self.queue_draw()
-                
-            elif state_type == "slewing":
-                self.slewing = payload.get("value", False)
+        match = _BOOL_PAYLOAD.fullmatch(payload)
+        if match is not None:
+            handler({"value": match.group(1) == b"true"})
+            return
+            
+        try:
+            payload_dict = decode_payload(payload)
+        except ValueError as e:
+            logger.error(f"Failed to decode JSON from {topic}: {e}")
+            return
+        handler(payload_dict)
+            
+    def _schedule_redraw(self, full=False):
+        """
+        Queue one redraw for all state updates handled in this main loop cycle.
+        
+        Args:
+            full: Redraw the whole widget rather than only the pointer and coordinates
+        """
+        self._full_redraw = self._full_redraw or full
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            GLib.idle_add(self._flush_redraw)
+            
+    def _flush_redraw(self):
+        """Redraw the preview once for the batched state updates."""
+        self._redraw_pending = False
+        full = self._full_redraw
+        self._full_redraw = False
+        
+        if full or self._last_pointer_rect is None:
+            if full or self.connected:
                 self.queue_draw()
+            return GLib.SOURCE_REMOVE
+            
+        # Only the pointer and the coordinate text moved: invalidate the union
+        # of the old and new pointer areas and the text strip
+        width = self.get_allocated_width()
+        height = self.get_allocated_height()
+        x, y = self._pointer_position(width, height)
+        extent = self.POINTER_EXTENT
+        old_x, old_y, old_w, old_h = self._last_pointer_rect
+        left = math.floor(min(old_x, x - extent))
+        top = math.floor(min(old_y, y - extent))
+        right = math.ceil(max(old_x + old_w, x + extent))
+        bottom = math.ceil(max(old_y + old_h, y + extent))
+        self.queue_draw_area(left, top, right - left, bottom - top)
+        self.queue_draw_area(0, height - self.COORD_TEXT_HEIGHT, width, self.COORD_TEXT_HEIGHT)
+        return GLib.SOURCE_REMOVE
+        
+    def _pointer_position(self, width, height):
+        """Return the widget coordinates of the pointer tip for the current Az/Alt."""
+        radius = min(width, height) / 2 - 20
+        az_rad = math.radians(self.azimuth)
+        # Altitude: 0° at edge, 90° at center
+        alt_radius = radius * (90 - self.altitude) / 90
+        return (width / 2 + alt_radius * math.sin(az_rad),
+                height / 2 - alt_radius * math.cos(az_rad))
+        
+    def _throttle_redraw(self, field, value):
+        """Schedule a redraw for a coordinate update unless it is too small and too soon."""
+        now = time.monotonic()
+        if (now - self._last_emit_ts[field] < self.MIN_REDRAW_INTERVAL
+                and abs(value - self._drawn_values[field]) < self.MIN_REDRAW_DELTA):
+            if self._trailing_redraw_id is None:
+                self._trailing_redraw_id = GLib.timeout_add(
+                    int(self.MIN_REDRAW_INTERVAL * 1000), self._flush_trailing_redraw)
+            return
+            
+        self._last_emit_ts[field] = now
+        self._drawn_values[field] = value
+        self._schedule_redraw()
+        
+    def _flush_trailing_redraw(self):
+        """Draw the coordinates skipped by _throttle_redraw()."""
+        self._trailing_redraw_id = None
+        now = time.monotonic()
+        for field in self._drawn_values:
+            self._last_emit_ts[field] = now
+            self._drawn_values[field] = getattr(self, field)
+        self._schedule_redraw()
+        return GLib.SOURCE_REMOVE
+        
+    def _set_connected(self, payload):
+        """Apply a telescope connection state update."""
+        value = payload.get("value", False)
+        if value == self.connected:
+            return
+        self.connected = value
+        self._schedule_redraw(full=True)
+        
+    def _set_azimuth(self, payload):
+        """Apply a telescope azimuth update."""
+        value = payload.get("value", 0.0)
+        if abs(value - self.azimuth) < self.DUPLICATE_DELTA:
+            return
+        self.azimuth = value
+        self._throttle_redraw('azimuth', value)
+        
+    def _set_altitude(self, payload):
+        """Apply a telescope altitude update."""
+        value = payload.get("value", 45.0)
+        if abs(value - self.altitude) < self.DUPLICATE_DELTA:
+            return
+        self.altitude = value
+        self._throttle_redraw('altitude', value)
+        
+    def _set_slewing(self, payload):
+        """Apply a telescope slewing state update."""
+        value = payload.get("value", False)
+        if value == self.slewing:
+            return
+        self.slewing = value
+        self._schedule_redraw()
                 
     def _on_draw(self, widget, cr):
         """Draw telescope preview."""
         width = widget.get_allocated_width()
         height = widget.get_allocated_height()
+        
+        # The background and sky grid only change with the widget size, so
+        # they are rendered once into an offscreen surface and blitted
+        if (width, height) != self._bg_size:
+            self._bg_size = (width, height)
+            self._bg_surface = self._render_background(cr.get_target(), width, height)
+            self._disconnected_surface = None
+            
+        if not self.connected:
+            # The disconnected view is static, so it is cached as a whole
+            self._last_pointer_rect = None
+            if self._disconnected_surface is None:
+                self._disconnected_surface = self._render_disconnected(cr.get_target(), width, height)
+            cr.set_source_surface(self._disconnected_surface, 0, 0)
+            cr.paint()
+            return
+            
+        cr.set_source_surface(self._bg_surface, 0, 0)
+        cr.paint()
+        
+        # Draw telescope pointer
+        az_rad = math.radians(self.azimuth)
+        sin_az = math.sin(az_rad)
+        cos_az = math.cos(az_rad)
+        x, y = self._pointer_position(width, height)
+        extent = self.POINTER_EXTENT
+        self._last_pointer_rect = (x - extent, y - extent, 2 * extent, 2 * extent)
+        
+        # Draw pointer
+        if self.slewing:
+            cr.set_source(_SLEWING)  # Orange when slewing
+        else:
+            cr.set_source(_IDLE)  # Green when idle
+            
+        # Draw triangle pointing in azimuth direction; the base corners lie
+        # at az + pi +/- 0.3, expanded with the angle addition identities
+        size = 15
+        cr.move_to(x, y)
+        cr.line_to(
+            x - size * (sin_az * _COS_03 + cos_az * _SIN_03),
+            y + size * (cos_az * _COS_03 - sin_az * _SIN_03)
+        )
+        cr.line_to(
+            x - size * (sin_az * _COS_03 - cos_az * _SIN_03),
+            y + size * (cos_az * _COS_03 + sin_az * _SIN_03)
+        )
+        cr.close_path()
+        cr.fill()
+        
+        # Draw circle at tip
+        cr.arc(x, y, 5, 0, math.tau)
+        cr.fill()
+        
+        # Draw coordinates text
+        cr.set_source(_COORD_TEXT)
+        cr.set_font_face(self._font_face)
+        cr.set_font_size(12)
+        coord_text = f"Az: {self.azimuth:.1f}°  Alt: {self.altitude:.1f}°"
+        cr.move_to(10, height - 10)
+        cr.show_text(coord_text)
+        
+    def _render_background(self, target, width, height):
+        """Render the background, horizon, cardinal directions and sky grid offscreen."""
+        # A similar surface keeps the target's device scale on HiDPI screens
+        surface = target.create_similar(cairo.CONTENT_COLOR, width, height)
+        cr = cairo.Context(surface)
         center_x = width / 2
         center_y = height / 2
         radius = min(width, height) / 2 - 20
         
         # Background
-        cr.set_source_rgb(0.1, 0.1, 0.15)
+        cr.set_source(_BACKGROUND)
         cr.rectangle(0, 0, width, height)
         cr.fill()
         
         # Draw horizon circle
-        cr.set_source_rgb(0.3, 0.3, 0.4)
+        cr.set_source(_HORIZON)
         cr.set_line_width(2)
-        cr.arc(center_x, center_y, radius, 0, 2 * math.pi)
+        cr.arc(center_x, center_y, radius, 0, math.tau)
         cr.stroke()
         
         # Draw cardinal directions
-        cr.set_source_rgb(0.6, 0.6, 0.7)
-        cr.select_font_face("Sans", 0, 0)
+        cr.set_source(_CARDINAL)
+        cr.set_font_face(self._font_face)
         cr.set_font_size(14)
         
         # N, E, S, W
@@ -90,73 +333,44 @@ class TelescopePreview(Gtk.DrawingArea):
                       center_y + dy + extents.height / 2)
             cr.show_text(text)
             
-        # Draw altitude circles (30, 60, 90 degrees)
-        cr.set_source_rgb(0.2, 0.2, 0.25)
+        # The altitude circles and azimuth lines share a style, so they are
+        # built as one path and stroked once
+        cr.set_source(_GRID)
         cr.set_line_width(1)
+        
+        # Draw altitude circles (30, 60, 90 degrees)
         for alt in [30, 60]:
             # Radius shrinks as altitude increases
             alt_radius = radius * (90 - alt) / 90
-            cr.arc(center_x, center_y, alt_radius, 0, 2 * math.pi)
-            cr.stroke()
+            # A new sub-path keeps arc() from joining the circles with a line
+            cr.new_sub_path()
+            cr.arc(center_x, center_y, alt_radius, 0, math.tau)
             
         # Draw azimuth lines (N, NE, E, SE, S, SW, W, NW)
-        cr.set_source_rgb(0.2, 0.2, 0.25)
-        cr.set_line_width(1)
-        for az_deg in range(0, 360, 45):
-            az_rad = math.radians(az_deg)
-            x = center_x + radius * math.sin(az_rad)
-            y = center_y - radius * math.cos(az_rad)
+        for sin_az, cos_az in _SPOKE_DIRECTIONS:
+            x = center_x + radius * sin_az
+            y = center_y - radius * cos_az
             cr.move_to(center_x, center_y)
             cr.line_to(x, y)
-            cr.stroke()
-            
-        if self.connected:
-            # Draw telescope pointer
-            az_rad = math.radians(self.azimuth)
-            # Altitude: 0° at edge, 90° at center
-            alt_radius = radius * (90 - self.altitude) / 90
-            
-            # Calculate position
-            x = center_x + alt_radius * math.sin(az_rad)
-            y = center_y - alt_radius * math.cos(az_rad)
-            
-            # Draw pointer
-            if self.slewing:
-                cr.set_source_rgb(1.0, 0.6, 0.0)  # Orange when slewing
-            else:
-                cr.set_source_rgb(0.2, 0.8, 0.2)  # Green when idle
-                
-            # Draw triangle pointing in azimuth direction
-            size = 15
-            cr.move_to(x, y)
-            cr.line_to(
-                x + size * math.sin(az_rad + math.pi + 0.3),
-                y - size * math.cos(az_rad + math.pi + 0.3)
-            )
-            cr.line_to(
-                x + size * math.sin(az_rad + math.pi - 0.3),
-                y - size * math.cos(az_rad + math.pi - 0.3)
-            )
-            cr.close_path()
-            cr.fill()
-            
-            # Draw circle at tip
-            cr.arc(x, y, 5, 0, 2 * math.pi)
-            cr.fill()
+        cr.stroke()
             
-            # Draw coordinates text
-            cr.set_source_rgb(1.0, 1.0, 1.0)
-            cr.set_font_size(12)
-            coord_text = f"Az: {self.azimuth:.1f}°  Alt: {self.altitude:.1f}°"
-            extents = cr.text_extents(coord_text)
-            cr.move_to(10, height - 10)
-            cr.show_text(coord_text)
-        else:
-            # Draw "Disconnected" message
-            cr.set_source_rgb(0.7, 0.7, 0.7)
-            cr.set_font_size(16)
-            text = "Telescope Disconnected"
-            extents = cr.text_extents(text)
-            cr.move_to(center_x - extents.width / 2,
-                      center_y + extents.height / 2)
-            cr.show_text(text)
+        return surface
+        
+    def _render_disconnected(self, target, width, height):
+        """Render the background with the "Telescope Disconnected" message offscreen."""
+        surface = target.create_similar(cairo.CONTENT_COLOR, width, height)
+        cr = cairo.Context(surface)
+        cr.set_source_surface(self._bg_surface, 0, 0)
+        cr.paint()
+        
+        # Draw "Disconnected" message
+        cr.set_source(_DISCONNECTED_TEXT)
+        cr.set_font_face(self._font_face)
+        cr.set_font_size(16)
+        text = "Telescope Disconnected"
+        extents = cr.text_extents(text)
+        cr.move_to(width / 2 - extents.width / 2,
+                   height / 2 + extents.height / 2)
+        cr.show_text(text)
+        
+        return surface